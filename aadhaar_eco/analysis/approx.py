@@ -0,0 +1,186 @@
+import pandas as pd
+import numpy as np
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from .sketches import CountMinSketch, HyperLogLog, TDigest
+
+# Shared pool for exact queries refining a preview answer in the background
+_executor = ThreadPoolExecutor(max_workers=2)
+
+class DatasetPreview:
+    """
+    Approximate-query companion to a cleaned dataset, built once at ingest.
+    Holds a sample stratified by state and date plus streaming sketches:
+    - Count-Min for district record counts (heavy hitters),
+    - t-digest per numeric column for volume quantiles,
+    - HyperLogLog for distinct pincodes.
+    Estimates come with 95% error bounds.
+    """
+
+    def __init__(self, df: pd.DataFrame, sample_frac: float = 0.02, min_per_stratum: int = 5,
+                 strata: tuple = ('state', 'date'), chunk_size: int = 250_000, seed: int = 42):
+        self.rows = 0
+        self.columns = df.columns.tolist()
+        self.numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+        self.strata = [c for c in strata if c in df.columns]
+        self.date_range = None
+
+        self.district_counts_sketch = CountMinSketch(seed=seed)
+        self.pincode_sketch = HyperLogLog()
+        self.quantile_sketches = {col: TDigest() for col in self.numeric_cols}
+        self._districts = set()
+
+        for start in range(0, len(df), chunk_size):
+            self.update(df.iloc[start:start + chunk_size])
+
+        self.sample = self._stratified_sample(df, sample_frac, min_per_stratum, seed)
+
+    def update(self, chunk: pd.DataFrame):
+        """Streams a chunk of rows into the sketches (the sample is fixed at ingest)."""
+        self.rows += len(chunk)
+        if {'state', 'district'}.issubset(chunk.columns):
+            keys = chunk['state'].astype(str) + '|' + chunk['district'].astype(str)
+            self.district_counts_sketch.update(keys.to_numpy())
+            self._districts.update(keys.unique())
+        if 'pincode' in chunk.columns:
+            self.pincode_sketch.update(chunk['pincode'].dropna().to_numpy())
+        for col, digest in self.quantile_sketches.items():
+            digest.update(chunk[col].to_numpy())
+        if 'date' in chunk.columns and chunk['date'].notna().any():
+            lo, hi = chunk['date'].min(), chunk['date'].max()
+            if self.date_range is not None:
+                lo, hi = min(lo, self.date_range[0]), max(hi, self.date_range[1])
+            self.date_range = (lo, hi)
+
+    def _stratified_sample(self, df: pd.DataFrame, frac: float, min_per_stratum: int, seed: int) -> pd.DataFrame:
+        """
+        Draws ceil(frac * N_h) rows (at least min_per_stratum) from every stratum.
+        Each sampled row carries the stratum weight N_h / n_h used for estimation.
+        """
+        if df.empty or not self.strata:
+            return df.assign(_stratum=0, _stratum_n=len(df), _weight=1.0)
+
+        rng = np.random.default_rng(seed)
+        shuffled = df.iloc[rng.permutation(len(df))]
+        grouped = shuffled.groupby(self.strata, dropna=False, sort=False)
+
+        stratum = grouped.ngroup()
+        size = grouped[self.strata[0]].transform('size')
+        n = np.minimum(size, np.maximum(np.ceil(size * frac), min_per_stratum))
+        keep = (grouped.cumcount() < n).to_numpy()
+
+        return shuffled[keep].assign(
+            _stratum=stratum.to_numpy()[keep],
+            _stratum_n=n.to_numpy()[keep],
+            _weight=(size / n).to_numpy()[keep]
+        ).reset_index(drop=True)
+
+    def estimate_totals(self, group_cols: List[str], value_col: Optional[str] = None, z: float = 1.96) -> pd.DataFrame:
+        """
+        Stratified estimate of value_col totals (or record counts if None) per group.
+        Returns group_cols, the estimate (named value_col or 'count') and 'error',
+        the half-width of the confidence interval at z standard errors.
+        Rows with missing group keys (e.g. NaT dates) are dropped, as in an exact groupby.
+        """
+        out_col = value_col or 'count'
+        s = self.sample
+        y = s[value_col].astype(float) if value_col else pd.Series(1.0, index=s.index)
+        frame = s[group_cols + ['_stratum', '_stratum_n', '_weight']].assign(_y=y, _y2=y ** 2)
+
+        # Domain totals per (group, stratum); rows outside the group count as zeros in the stratum
+        cells = frame.groupby(group_cols + ['_stratum'], observed=True).agg(
+            _sum=('_y', 'sum'), _sq=('_y2', 'sum'), n=('_stratum_n', 'first'), w=('_weight', 'first')
+        ).reset_index()
+
+        n, N = cells['n'], cells['w'] * cells['n']
+        s2 = ((cells['_sq'] - cells['_sum'] ** 2 / n) / (n - 1)).where(n > 1, 0).clip(lower=0)
+        cells['estimate'] = cells['w'] * cells['_sum']
+        cells['variance'] = N ** 2 * (1 - n / N) * s2 / n
+
+        totals = cells.groupby(group_cols).agg(estimate=('estimate', 'sum'), variance=('variance', 'sum')).reset_index()
+        totals[out_col] = totals['estimate'].round().astype('int64')
+        totals['error'] = (z * np.sqrt(totals['variance'])).round().astype('int64')
+        return totals[group_cols + [out_col, 'error']]
+
+    def district_counts(self) -> pd.DataFrame:
+        """Count-Min record counts per district; true count lies in [count - error, count]."""
+        keys = sorted(self._districts)
+        if not keys:
+            return pd.DataFrame()
+        counts = self.district_counts_sketch.estimate(keys)
+        state, district = zip(*(k.split('|', 1) for k in keys))
+        result = pd.DataFrame({'state': state, 'district': district, 'count': counts})
+        result['error'] = round(self.district_counts_sketch.error_bound)
+        return result.sort_values(by='count', ascending=False)
+
+    def heavy_hitters(self, top_n: int = 10) -> pd.DataFrame:
+        """Districts with the most records, from the Count-Min sketch."""
+        return self.district_counts().head(top_n)
+
+    def distinct_pincodes(self) -> Dict[str, float]:
+        """HyperLogLog distinct pincode count with a 95% error bound."""
+        estimate = self.pincode_sketch.estimate()
+        return {"estimate": round(estimate), "error": round(1.96 * self.pincode_sketch.relative_error * estimate)}
+
+    def quantiles(self, value_col: str, qs: tuple = (0.5, 0.9, 0.99)) -> pd.DataFrame:
+        """t-digest quantiles of value_col with the bracketing centroid means as bounds."""
+        digest = self.quantile_sketches[value_col]
+        rows = []
+        for q in qs:
+            lower, upper = digest.quantile_bounds(q)
+            rows.append({"quantile": q, value_col: digest.quantile(q), "lower": lower, "upper": upper})
+        return pd.DataFrame(rows)
+
+    def basic_stats(self) -> Dict[str, Any]:
+        """Same shape as EDAService.get_basic_stats; missing counts are estimated from the sample."""
+        missing = self.sample[self.columns].isnull().mul(self.sample['_weight'], axis=0).sum().round().astype(int)
+        return {
+            "rows": self.rows,
+            "columns": self.columns,
+            "missing_values": missing.to_dict(),
+            "date_range": self.date_range
+        }
+
+class ProgressiveResult:
+    """
+    Answers immediately with an approximate value while the exact
+    computation runs on a background thread. If the background run fails,
+    the error is kept in `error` and the exact query is re-run in the foreground.
+    The exact function (and whatever data it closes over) is released once it succeeds.
+    """
+
+    def __init__(self, approximate: Any, exact_fn: Callable[[], Any]):
+        self.approximate = approximate
+        self.error: Optional[BaseException] = None
+        self._exact_fn = exact_fn
+        self._future = _executor.submit(exact_fn)
+        self._future.add_done_callback(self._release)
+
+    def _release(self, future: Future):
+        if future.exception() is None:
+            self._exact_fn = None
+
+    @property
+    def done(self) -> bool:
+        """True once the background run has finished, successfully or not."""
+        return self._future.done()
+
+    @property
+    def is_exact(self) -> bool:
+        return self._future.done() and self._future.exception() is None
+
+    def result(self) -> Any:
+        """The exact answer if it has finished, otherwise the approximation."""
+        if self._future.done() and self._future.exception() is not None:
+            self.error = self._future.exception()
+            # Foreground fallback; an exception here propagates to the caller
+            fallback = Future()
+            fallback.set_result(self._exact_fn())
+            self._future = fallback
+            self._exact_fn = None
+        return self._future.result() if self.is_exact else self.approximate
+
+    def exact(self, timeout: Optional[float] = None) -> Any:
+        """Blocks until the exact answer is available."""
+        return self._future.result(timeout)
@@ -1,17 +1,31 @@
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from .approx import DatasetPreview
 
 class EDAService:
     """
     Automated Exploratory Data Analysis service.
     Generates summary stats and Plotly figures for the dashboard.
+    Passing a DatasetPreview switches a method to approximate mode:
+    group totals come from the stratified sample, with error bounds.
+    Daily trends have no approximate mode: a single groupby on the date
+    column costs about as much as the estimate itself.
     """
 
     @staticmethod
-    def get_basic_stats(df: pd.DataFrame) -> Dict[str, Any]:
+    def _group_sum(df: pd.DataFrame, group_col: str, value_col: str, preview: Optional[DatasetPreview] = None) -> pd.DataFrame:
+        """Exact groupby sum, or the preview's estimate (with an 'error' column)."""
+        if preview is not None:
+            return preview.estimate_totals([group_col], value_col)
+        return df.groupby(group_col)[value_col].sum().reset_index()
+
+    @staticmethod
+    def get_basic_stats(df: pd.DataFrame, preview: Optional[DatasetPreview] = None) -> Dict[str, Any]:
         """Returns row count, column list, and potential missing value flags."""
+        if preview is not None:
+            return preview.basic_stats()
         return {
             "rows": len(df),
             "columns": df.columns.tolist(),
@@ -43,12 +57,12 @@ class EDAService:
                 f"Peak activity was observed on **{peak_date.strftime('%Y-%m-%d')}** with {peak_val:,} records.")
 
     @staticmethod
-    def generate_distribution_insight(df: pd.DataFrame, group_col='state', value_col=None) -> str:
+    def generate_distribution_insight(df: pd.DataFrame, group_col='state', value_col=None, preview: Optional[DatasetPreview] = None) -> str:
         """Generates a text insight about the distribution."""
         if group_col not in df.columns or value_col not in df.columns:
             return ""
             
-        grouped = df.groupby(group_col)[value_col].sum().sort_values(ascending=False)
+        grouped = EDAService._group_sum(df, group_col, value_col, preview).set_index(group_col)[value_col].sort_values(ascending=False)
         if grouped.empty:
             return ""
             
@@ -72,13 +86,14 @@ class EDAService:
         return fig
 
     @staticmethod
-    def plot_state_distribution(df: pd.DataFrame, state_col='state', value_col=None):
+    def plot_state_distribution(df: pd.DataFrame, state_col='state', value_col=None, preview: Optional[DatasetPreview] = None):
         """Generates a bar chart of values per state."""
         if state_col not in df.columns or value_col not in df.columns:
             return None
             
-        state_agg = df.groupby(state_col)[value_col].sum().reset_index().sort_values(by=value_col, ascending=False)
-        fig = px.bar(state_agg, x=state_col, y=value_col, title=f"Distribution by State ({value_col})")
+        state_agg = EDAService._group_sum(df, state_col, value_col, preview).sort_values(by=value_col, ascending=False)
+        fig = px.bar(state_agg, x=state_col, y=value_col, title=f"Distribution by State ({value_col})",
+                     error_y='error' if preview is not None else None)
         return fig
     
     @staticmethod
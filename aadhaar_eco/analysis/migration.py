@@ -0,0 +1,201 @@
+import pandas as pd
+import numpy as np
+from scipy import sparse
+from scipy.stats import poisson
+
+class MigrationMatrix:
+    """
+    Sparse pincode x date matrix of demographic update activity.
+    Built once from the demographic data; volatility and cross-region surge
+    correlation are computed with sparse reductions instead of repeated groupbys.
+    """
+
+    LEVELS = ('pincode', 'district', 'state')
+    # S @ S.T over more surging regions than this needs gigabytes (e.g. ~19k pincodes)
+    MAX_PAIR_REGIONS = 5000
+
+    def __init__(self, demographic_df: pd.DataFrame, surge_threshold: float = 2.0):
+        required = {'state', 'district', 'pincode', 'date'}
+        missing = required - set(demographic_df.columns)
+        if missing:
+            raise ValueError(f"Demographic data is missing columns: {sorted(missing)}")
+
+        self.surge_threshold = surge_threshold
+
+        # Rows are (state, district, pincode) so district/state roll-ups stay exact
+        # even when a pincode is reported under more than one district.
+        pincodes, row_codes = self._group(demographic_df, ['state', 'district', 'pincode'])
+        date_codes, self.dates = pd.factorize(demographic_df['date'], sort=True)
+
+        # Each record counts as one update (same unit as detect_migration_signals).
+        # Duplicate (row, date) entries are summed when converting to CSR.
+        valid = (row_codes >= 0) & (date_codes >= 0)
+        self.matrix = sparse.coo_matrix(
+            (np.ones(valid.sum()), (row_codes[valid], date_codes[valid])),
+            shape=(len(pincodes), len(self.dates))
+        ).tocsr()
+
+        districts, self._district_codes = self._group(pincodes, ['state', 'district'])
+        states, state_codes = self._group(pincodes, ['state'])
+
+        # Level -> (labels, aggregation matrix mapping pincode rows onto that level)
+        self._levels = {
+            'pincode': (pincodes, sparse.identity(len(pincodes), format='csr')),
+            'district': (districts, self._indicator(self._district_codes, len(districts))),
+            'state': (states, self._indicator(state_codes, len(states))),
+        }
+        self._cache = {}
+
+    @staticmethod
+    def _group(labels: pd.DataFrame, cols: list):
+        """
+        Returns the unique label rows for cols and each input row's code into them
+        (-1 where a key is missing). Factorizes each column and combines the codes
+        into one integer key, which is far faster than factorizing a MultiIndex.
+        """
+        combined = np.zeros(len(labels), dtype=np.int64)
+        missing = np.zeros(len(labels), dtype=bool)
+        for col in cols:
+            col_codes, uniques = pd.factorize(labels[col])
+            missing |= col_codes < 0
+            combined = combined * len(uniques) + col_codes
+
+        codes = np.full(len(labels), -1, dtype=np.int64)
+        codes[~missing] = pd.factorize(combined[~missing])[0]
+        # Codes appear in first-seen order, so each group's first row is where the
+        # running maximum code steps up (avoids sorting all rows)
+        running = np.maximum.accumulate(codes) if len(codes) else codes
+        first = np.flatnonzero(np.r_[running[:1] >= 0, running[1:] > running[:-1]])
+        keys = labels[cols].iloc[first].reset_index(drop=True)
+        return keys, codes
+
+    @staticmethod
+    def _indicator(codes: np.ndarray, n_groups: int) -> sparse.csr_matrix:
+        """Sparse (n_groups x n_rows) 0/1 matrix; left-multiplying sums rows per group."""
+        return sparse.csr_matrix(
+            (np.ones(len(codes)), (codes, np.arange(len(codes)))),
+            shape=(n_groups, len(codes))
+        )
+
+    def level_matrix(self, level: str = 'district') -> sparse.csr_matrix:
+        """Region x date activity matrix at the requested level."""
+        if level not in self.LEVELS:
+            raise ValueError(f"Level '{level}' not supported. Available: {list(self.LEVELS)}")
+        if level not in self._cache:
+            _, agg = self._levels[level]
+            self._cache[level] = (agg @ self.matrix).tocsr()
+        return self._cache[level]
+
+    def _row_moments(self, X: sparse.csr_matrix):
+        """Per-row mean and sample std over all dates (zero-activity days included)."""
+        n = X.shape[1]
+        total = np.asarray(X.sum(axis=1)).ravel()
+        sq_total = np.asarray(X.multiply(X).sum(axis=1)).ravel()
+        mean = total / max(n, 1)
+        if n < 2:
+            return mean, np.zeros_like(mean)
+        var = np.clip((sq_total - n * mean ** 2) / (n - 1), 0, None)
+        return mean, np.sqrt(var)
+
+    def volatility(self, level: str = 'district') -> pd.DataFrame:
+        """
+        Variance of daily update counts per region, with the same Z-Score
+        normalization as PolicyAnalyzer.detect_migration_signals.
+        Unlike the groupby version, days with no updates count as zero.
+        """
+        X = self.level_matrix(level)
+        labels, _ = self._levels[level]
+        _, std = self._row_moments(X)
+
+        result = labels.copy()
+        result['total_updates'] = np.asarray(X.sum(axis=1)).ravel().astype(int)
+        result['raw_volatility'] = std ** 2
+
+        std_var = result['raw_volatility'].std()
+        result['volatility_score'] = ((result['raw_volatility'] - result['raw_volatility'].mean()) / std_var).fillna(0)
+
+        return result.sort_values(by='volatility_score', ascending=False)
+
+    def surge_matrix(self, level: str = 'district') -> sparse.csr_matrix:
+        """
+        Binary region x date matrix marking surge days: daily count at least
+        surge_threshold standard deviations above that region's mean.
+        """
+        X = self.level_matrix(level)
+        mean, std = self._row_moments(X)
+
+        # A positive threshold can only be crossed by a non-zero entry,
+        # so the test runs on the stored values alone.
+        rows = np.repeat(np.arange(X.shape[0]), np.diff(X.indptr))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z = (X.data - mean[rows]) / std[rows]
+        hit = np.nan_to_num(z) >= self.surge_threshold
+
+        return sparse.csr_matrix(
+            (np.ones(hit.sum()), (rows[hit], X.indices[hit])),
+            shape=X.shape
+        )
+
+    def correlated_surges(self, level: str = 'district', min_co_surges: int = 2, alpha: float = 0.01) -> pd.DataFrame:
+        """
+        Pairs of regions that surge on the same days more often than chance.
+        Co-surge counts come from one sparse product S @ S.T over surging regions.
+        Under independence a pair shares about s_a * s_b / n_days surge days, so
+        each count is tested against that Poisson expectation, Bonferroni-corrected
+        over all pairs. Overlap is the Jaccard index of the two regions' surge days.
+        Refuses levels with more than MAX_PAIR_REGIONS surging regions.
+        """
+        S = self.surge_matrix(level)
+        labels, _ = self._levels[level]
+        surge_days = np.asarray(S.sum(axis=1)).ravel()
+
+        active = np.flatnonzero(surge_days)
+        if len(active) > self.MAX_PAIR_REGIONS:
+            raise ValueError(f"{len(active)} surging regions at level '{level}' exceeds "
+                             f"MAX_PAIR_REGIONS={self.MAX_PAIR_REGIONS}; use a coarser level.")
+        S = S[active]
+
+        co = sparse.triu(S @ S.T, k=1).tocoo()
+        keep = co.data >= min_co_surges
+        a, b, shared = active[co.row[keep]], active[co.col[keep]], co.data[keep]
+
+        expected = surge_days[a] * surge_days[b] / max(S.shape[1], 1)
+        p_value = poisson.sf(shared - 1, expected)
+        n_pairs = max(len(active) * (len(active) - 1) // 2, 1)
+        significant = p_value < alpha / n_pairs
+        a, b, shared = a[significant], b[significant], shared[significant]
+        expected, p_value = expected[significant], p_value[significant]
+
+        if not len(shared):
+            return pd.DataFrame()
+
+        region_a = labels.iloc[a].reset_index(drop=True).add_suffix('_a')
+        region_b = labels.iloc[b].reset_index(drop=True).add_suffix('_b')
+        pairs = pd.concat([region_a, region_b], axis=1)
+        pairs['co_surges'] = shared.astype(int)
+        pairs['expected_co_surges'] = expected.round(2)
+        pairs['surge_overlap'] = (shared / (surge_days[a] + surge_days[b] - shared)).round(3)
+        pairs['p_value'] = p_value
+
+        return pairs.sort_values(by=['p_value', 'co_surges'], ascending=[True, False])
+
+    def surge_sources(self, state: str, district: str, top_n: int = 5) -> pd.DataFrame:
+        """
+        Pincodes driving a district's surges: update volume on the district's
+        surge days, and each pincode's share of that volume.
+        """
+        districts, _ = self._levels['district']
+        match = np.flatnonzero((districts['state'] == state) & (districts['district'] == district))
+        if not len(match):
+            return pd.DataFrame()
+
+        surge_days = self.surge_matrix('district')[match[0]]
+        pin_rows = np.flatnonzero(self._district_codes == match[0])
+        surge_volume = np.asarray((self.matrix[pin_rows] @ surge_days.T).todense()).ravel()
+
+        result = self._levels['pincode'][0].iloc[pin_rows].reset_index(drop=True)
+        result['surge_volume'] = surge_volume.astype(int)
+        total = surge_volume.sum()
+        result['surge_share'] = (surge_volume / total * 100).round(1) if total > 0 else 0.0
+
+        return result.sort_values(by='surge_volume', ascending=False).head(top_n)
@@ -1,22 +1,43 @@
 import pandas as pd
 import numpy as np
+from typing import Optional
+from .approx import DatasetPreview
+from .migration import MigrationMatrix
 
 class PolicyAnalyzer:
     """
     Computes high-level governance indicators for UIDAI policy planning.
     Focuses on aggregated trends to ensure privacy.
+    Passing DatasetPreviews switches a method to approximate mode; estimated
+    volumes then carry a '<column>_error' bound alongside them, and derived
+    scores carry a bound propagated from those volume errors. Propagated bounds
+    treat normalisation constants (min/max over districts) as fixed, so they are
+    conservative interval arithmetic rather than exact confidence intervals.
     """
 
     @staticmethod
-    def calculate_ghost_child_risk(enrolment_df: pd.DataFrame, demographic_df: pd.DataFrame) -> pd.DataFrame:
+    def _aggregate(df: pd.DataFrame, group_cols: list, value_col: Optional[str] = None, name: Optional[str] = None,
+                   preview: Optional[DatasetPreview] = None) -> pd.DataFrame:
+        """Exact groupby sum (record count if value_col is None), or the preview's estimate."""
+        name = name or value_col
+        if preview is not None:
+            estimate = preview.estimate_totals(group_cols, value_col)
+            return estimate.rename(columns={value_col or 'count': name, 'error': f'{name}_error'})
+        if value_col is None:
+            return df.groupby(group_cols).size().reset_index(name=name)
+        return df.groupby(group_cols)[value_col].sum().reset_index().rename(columns={value_col: name})
+
+    @staticmethod
+    def calculate_ghost_child_risk(enrolment_df: pd.DataFrame, demographic_df: pd.DataFrame,
+                                   enrolment_preview: Optional[DatasetPreview] = None,
+                                   demographic_preview: Optional[DatasetPreview] = None) -> pd.DataFrame:
         """
         Idea 1: Ghost Child Awareness Indicator.
         Compares normalized Age 0-5 Enrolment volumes against Age 5-17 Demographic Updates.
         High Enrolment (0-5) but Low Updates (5-17) may indicate 'drop-off' or lack of continuity.
         """
         # Aggregate by District
-        enrol_0_5 = enrolment_df.groupby(['state', 'district'])['age_0_5'].sum().reset_index()
-        enrol_0_5.rename(columns={'age_0_5': 'enrolment_vol'}, inplace=True)
+        enrol_0_5 = PolicyAnalyzer._aggregate(enrolment_df, ['state', 'district'], 'age_0_5', 'enrolment_vol', enrolment_preview)
         
         # We need to be careful if 'demo_age_5_17' column exists or needs inference
         # Based on schema check: demographic df has 'demo_age_5_17'
@@ -24,8 +45,7 @@ class PolicyAnalyzer:
              # Fallback if specific column missing
              return pd.DataFrame()
 
-        update_5_17 = demographic_df.groupby(['state', 'district'])['demo_age_5_17'].sum().reset_index()
-        update_5_17.rename(columns={'demo_age_5_17': 'update_vol'}, inplace=True)
+        update_5_17 = PolicyAnalyzer._aggregate(demographic_df, ['state', 'district'], 'demo_age_5_17', 'update_vol', demographic_preview)
         
         # Merge
         merged = pd.merge(enrol_0_5, update_5_17, on=['state', 'district'], how='inner')
@@ -38,13 +58,25 @@ class PolicyAnalyzer:
         merged['risk_index'] = 1 / (merged['continuity_ratio'] + 0.001) 
         
         # Normalize Index 0-100
-        merged['risk_score'] = (merged['risk_index'] - merged['risk_index'].min()) / \
-                               (merged['risk_index'].max() - merged['risk_index'].min()) * 100
+        lo, hi = merged['risk_index'].min(), merged['risk_index'].max()
+        merged['risk_score'] = (merged['risk_index'] - lo) / (hi - lo) * 100
+
+        if 'enrolment_vol_error' in merged.columns or 'update_vol_error' in merged.columns:
+            # Risk rises with enrolments and falls with updates, so the extremes pair opposite ends
+            enrol_err = merged.get('enrolment_vol_error', 0)
+            update_err = merged.get('update_vol_error', 0)
+            for bound, sign in (('low', -1), ('high', 1)):
+                enrol = (merged['enrolment_vol'] + sign * enrol_err).clip(lower=0)
+                update = (merged['update_vol'] - sign * update_err).clip(lower=0)
+                index = 1 / (update / (enrol + 1) + 0.001)
+                merged[f'risk_score_{bound}'] = ((index - lo) / (hi - lo) * 100).clip(0, 100)
                                
         return merged.sort_values(by='risk_score', ascending=False)
 
     @staticmethod
-    def analyze_youth_engagement(demographic_df: pd.DataFrame, biometric_df: pd.DataFrame) -> pd.DataFrame:
+    def analyze_youth_engagement(demographic_df: pd.DataFrame, biometric_df: pd.DataFrame,
+                                 demographic_preview: Optional[DatasetPreview] = None,
+                                 biometric_preview: Optional[DatasetPreview] = None) -> pd.DataFrame:
         """
         Idea 2: Youth Connection & Awareness Gap.
         Compare Demographic Updates (5-17) vs Biometric Updates (17+).
@@ -53,11 +85,13 @@ class PolicyAnalyzer:
         if 'demo_age_5_17' not in demographic_df.columns or 'bio_age_17_' not in biometric_df.columns:
             return pd.DataFrame()
             
-        demo_yg = demographic_df.groupby(['state'])['demo_age_5_17'].sum().reset_index()
-        bio_adult = biometric_df.groupby(['state'])['bio_age_17_'].sum().reset_index()
+        demo_yg = PolicyAnalyzer._aggregate(demographic_df, ['state'], 'demo_age_5_17', preview=demographic_preview)
+        bio_adult = PolicyAnalyzer._aggregate(biometric_df, ['state'], 'bio_age_17_', preview=biometric_preview)
         
         merged = pd.merge(demo_yg, bio_adult, on='state', how='inner')
         merged['engagement_gap'] = abs(merged['demo_age_5_17'] - merged['bio_age_17_'])
+        if 'demo_age_5_17_error' in merged.columns or 'bio_age_17__error' in merged.columns:
+            merged['engagement_gap_error'] = merged.get('demo_age_5_17_error', 0) + merged.get('bio_age_17__error', 0)
         
         return merged.sort_values(by='engagement_gap', ascending=False)
 
@@ -66,33 +100,33 @@ class PolicyAnalyzer:
         """
         Idea 3: Migration Intelligence.
         High volume of demographic updates (address changes) in short periods.
+        Delegates to MigrationMatrix so every view shares one volatility definition
+        (days without updates count as zero). Always exact: the variance of weighted
+        sample counts is dominated by sampling noise, so there is no approximate mode.
         """
-        # Group by District and Date
-        daily_updates = demographic_df.groupby(['state', 'district', 'date']).size().reset_index(name='update_count')
-        
-        # Calculate Variance (Volatility)
-        district_variance = daily_updates.groupby(['state', 'district'])['update_count'].var().reset_index()
-        district_variance.rename(columns={'update_count': 'raw_volatility'}, inplace=True)
-        
-        # Z-Score Normalization
-        mean_var = district_variance['raw_volatility'].mean()
-        std_var = district_variance['raw_volatility'].std()
-        district_variance['volatility_score'] = ((district_variance['raw_volatility'] - mean_var) / std_var).fillna(0)
-        
-        return district_variance.sort_values(by='volatility_score', ascending=False)
+        return MigrationMatrix(demographic_df).volatility('district')
 
     @staticmethod
-    def assess_kendra_performance(enrolment_df: pd.DataFrame, update_df: pd.DataFrame) -> pd.DataFrame:
+    def assess_kendra_performance(enrolment_df: pd.DataFrame, update_df: pd.DataFrame,
+                                  enrolment_preview: Optional[DatasetPreview] = None,
+                                  update_preview: Optional[DatasetPreview] = None) -> pd.DataFrame:
         """
         Idea 5: Aadhaar Kendra Performance Signal.
         Assists in optimizing service center capacity.
         Logic: Combined volume of Enrolments + Updates per district.
+        In approximate mode, district record counts come from the Count-Min sketches.
         """
         # Aggregate Enrolment Volume
-        e_vol = enrolment_df.groupby(['state', 'district']).size().reset_index(name='enrol_vol')
+        if enrolment_preview is not None:
+            e_vol = enrolment_preview.district_counts().rename(columns={'count': 'enrol_vol', 'error': 'enrol_vol_error'})
+        else:
+            e_vol = enrolment_df.groupby(['state', 'district']).size().reset_index(name='enrol_vol')
         
         # Aggregate Update Volume (Demographic)
-        u_vol = update_df.groupby(['state', 'district']).size().reset_index(name='update_vol')
+        if update_preview is not None:
+            u_vol = update_preview.district_counts().rename(columns={'count': 'update_vol', 'error': 'update_vol_error'})
+        else:
+            u_vol = update_df.groupby(['state', 'district']).size().reset_index(name='update_vol')
         
         # Merge
         perf_df = pd.merge(e_vol, u_vol, on=['state', 'district'], how='outer').fillna(0)
@@ -101,6 +135,9 @@ class PolicyAnalyzer:
         # Normalize 0-100 (Performance Index)
         max_act = perf_df['total_activity'].max()
         perf_df['performance_score'] = (perf_df['total_activity'] / max_act * 100).round(1)
+        error_cols = [c for c in ('enrol_vol_error', 'update_vol_error') if c in perf_df.columns]
+        if error_cols:
+            perf_df['performance_score_error'] = (perf_df[error_cols].sum(axis=1) / max_act * 100).round(1)
         
         # Assign Tiers
         conditions = [
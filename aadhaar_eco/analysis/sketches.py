@@ -0,0 +1,146 @@
+import pandas as pd
+import numpy as np
+
+def _hash(keys, hash_key: str = '0123456789123456') -> np.ndarray:
+    """64-bit hashes of keys. Keys are hashed as strings so int and str pincodes agree."""
+    values = pd.Series(keys).astype(str).to_numpy(dtype=object)
+    return pd.util.hash_array(values, hash_key=hash_key)
+
+class CountMinSketch:
+    """
+    Fixed-size frequency sketch for heavy-hitter counts.
+    Estimates never undercount; they overcount by at most error_bound
+    with probability 1 - exp(-depth).
+    """
+
+    def __init__(self, width: int = 16384, depth: int = 5, seed: int = 42):
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int64)
+        self.total = 0
+        self._hash_key = f"{seed:016d}"
+
+    def _buckets(self, keys) -> list:
+        # Double hashing: row i uses h1 + i * h2, both halves of a single 64-bit hash
+        h = _hash(keys, self._hash_key)
+        h1 = (h & np.uint64(0xFFFFFFFF)).astype(np.int64)
+        h2 = (h >> np.uint64(32)).astype(np.int64) | 1
+        return [(h1 + row * h2) % self.width for row in range(self.depth)]
+
+    def update(self, keys, counts=None):
+        """Adds counts (default 1 each) for a batch of keys."""
+        counts = np.ones(len(keys), dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+        for row, buckets in enumerate(self._buckets(keys)):
+            self.table[row] += np.bincount(buckets, weights=counts, minlength=self.width).astype(np.int64)
+        self.total += int(counts.sum())
+
+    def estimate(self, keys) -> np.ndarray:
+        """Estimated count per key (minimum over rows)."""
+        rows = [self.table[row, buckets] for row, buckets in enumerate(self._buckets(keys))]
+        return np.min(rows, axis=0)
+
+    @property
+    def error_bound(self) -> float:
+        """Maximum overcount (e / width * total) at the sketch's confidence."""
+        return np.e / self.width * self.total
+
+class HyperLogLog:
+    """
+    Distinct-count sketch using 2^p one-byte registers.
+    Relative standard error is 1.04 / sqrt(2^p).
+    """
+
+    def __init__(self, p: int = 14):
+        # p >= 11 keeps the remaining 64 - p hash bits exact as float64
+        self.p = p
+        self.m = 1 << p
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    def update(self, keys):
+        """Adds a batch of keys."""
+        h = _hash(keys)
+        idx = (h >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = h & np.uint64((1 << (64 - self.p)) - 1)
+        # Rank = position of the leftmost 1-bit in the remaining bits (all zeros -> 64 - p + 1)
+        rank = (64 - self.p) - np.frexp(rest.astype(np.float64))[1] + 1
+        best = pd.Series(rank).groupby(idx).max()
+        self.registers[best.index] = np.maximum(self.registers[best.index], best.to_numpy())
+
+    def estimate(self) -> float:
+        """Estimated number of distinct keys seen."""
+        alpha = 0.7213 / (1 + 1.079 / self.m)
+        raw = alpha * self.m ** 2 / np.sum(2.0 ** -self.registers.astype(np.float64))
+        zeros = np.count_nonzero(self.registers == 0)
+        if raw <= 2.5 * self.m and zeros:
+            # Small-range correction (linear counting)
+            return self.m * np.log(self.m / zeros)
+        return raw
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / np.sqrt(self.m)
+
+class TDigest:
+    """
+    Merging t-digest for streaming quantiles.
+    Centroids are small in the tails and large in the middle, so extreme
+    quantiles (p99 volumes) stay accurate with about compression / 2 centroids.
+    """
+
+    def __init__(self, compression: int = 200):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values, weights=None):
+        """Merges a batch of values into the digest."""
+        values = np.asarray(values, dtype=np.float64)
+        weights = np.ones(len(values)) if weights is None else np.asarray(weights, dtype=np.float64)
+        keep = ~np.isnan(values)
+        values, weights = values[keep], weights[keep]
+        if not len(values):
+            return
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+        means = np.concatenate([self.means, values])
+        w = np.concatenate([self.weights, weights])
+        order = np.argsort(means, kind='mergesort')
+        means, w = means[order], w[order]
+
+        # Scale function k1: points whose mid-quantiles share a unit k-interval merge
+        cum = np.cumsum(w)
+        q_mid = (cum - w / 2) / cum[-1]
+        k = self.compression / (2 * np.pi) * np.arcsin(2 * q_mid - 1)
+        cluster = np.floor(k - k.min()).astype(np.int64)
+
+        self.weights = np.bincount(cluster, weights=w)
+        nonempty = self.weights > 0
+        self.means = np.bincount(cluster, weights=means * w)[nonempty] / self.weights[nonempty]
+        self.weights = self.weights[nonempty]
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    def _positions(self) -> np.ndarray:
+        return np.cumsum(self.weights) - self.weights / 2
+
+    def quantile(self, q: float) -> float:
+        """Interpolated value at quantile q (0-1)."""
+        if not len(self.means):
+            return np.nan
+        pos = np.concatenate([[0], self._positions(), [self.count]])
+        means = np.concatenate([[self.min], self.means, [self.max]])
+        return float(np.interp(q * self.count, pos, means))
+
+    def quantile_bounds(self, q: float) -> tuple:
+        """Means of the two centroids bracketing quantile q; the estimate lies between them."""
+        if not len(self.means):
+            return (np.nan, np.nan)
+        j = np.searchsorted(self._positions(), q * self.count)
+        lower = self.means[j - 1] if j > 0 else self.min
+        upper = self.means[j] if j < len(self.means) else self.max
+        return (float(lower), float(upper))
@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 import sys
 import os
+import time
 import plotly.express as px
 
 # Check if running from correct dir, if not add to path
@@ -13,6 +14,8 @@ from aadhaar_eco.analysis.eda import EDAService
 from aadhaar_eco.analysis.clustering import DistrictClusterer
 from aadhaar_eco.analysis.anomaly import AnomalyDetector
 from aadhaar_eco.analysis.policy import PolicyAnalyzer
+from aadhaar_eco.analysis.migration import MigrationMatrix
+from aadhaar_eco.analysis.approx import DatasetPreview, ProgressiveResult
 
 st.set_page_config(page_title="Aadhaar Insight", layout="wide", page_icon="🆔")
 
@@ -32,7 +35,9 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
+# cache_resource rather than cache_data: every rerun shares the same frames instead of a
+# fresh copy, so background jobs closing over them do not pin extra copies of the data
+@st.cache_resource
 def load_data():
     base_path = "C:\\Users\\goura\\OneDrive\\Desktop\\UIDAI Hackathon"
     loader = DataLoader(base_path)
@@ -42,7 +47,52 @@ def load_data():
     for cat in data:
         data[cat] = DataCleaner.process(data[cat])
     
-    return data
+    # Version stamp lets derived resources and background jobs follow a reload
+    return data, time.time()
+
+@st.cache_resource
+def load_migration_matrix(data_version):
+    # Built once per data load; all migration views reuse the same sparse matrix
+    return MigrationMatrix(load_data()[0]['demographic'])
+
+@st.cache_resource
+def load_previews(data_version):
+    # Stratified samples and sketches are built at ingest, alongside load_data
+    return {cat: DatasetPreview(df) for cat, df in load_data()[0].items()}
+
+def progressive(key, approx_fn, exact_fn):
+    """
+    In preview mode, answers from the previews immediately and keeps the exact
+    query running in the background. Returns (result, is_exact).
+    """
+    if not st.session_state.get('preview_mode'):
+        return exact_fn(), True
+    jobs = st.session_state.setdefault('progressive_jobs', {})
+    if key not in jobs:
+        jobs[key] = ProgressiveResult(approx_fn(), exact_fn)
+    job = jobs[key]
+    result = job.result()
+    if job.error is not None:
+        st.warning(f"Background refinement failed ({job.error}); the exact result was computed in the foreground instead.")
+    if not job.is_exact:
+        st.session_state.setdefault('progressive_pending', set()).add(key)
+    return result, job.is_exact
+
+def preview_note(is_exact):
+    if not is_exact:
+        st.caption("⚡ **Preview:** Estimated from a stratified sample and sketches; error bars and error columns are conservative 95% bounds. Refreshes automatically when the exact result is ready.")
+
+def with_bounds(frame, cols, bound_cols):
+    # Bound columns only exist on approximate results
+    return frame[cols + [c for c in bound_cols if c in frame.columns]]
+
+@st.fragment(run_every=1.0)
+def refresh_when_exact():
+    # Polls the jobs shown as previews on this run and reruns the page once any of them finishes
+    jobs = st.session_state.get('progressive_jobs', {})
+    pending = st.session_state.get('progressive_pending', set())
+    if any(key not in jobs or jobs[key].done for key in pending):
+        st.rerun()
 
 def main():
     st.title("🆔 Aadhaar Insight: National Governance Intelligence Framework")
@@ -50,7 +100,8 @@ def main():
     
     with st.spinner("Loading and Consolidating Multi-Source Data..."):
         try:
-            data = load_data()
+            data, data_version = load_data()
+            previews = load_previews(data_version)
         except Exception as e:
             st.error(f"Error loading data: {e}")
             return
@@ -59,11 +110,21 @@ def main():
         st.warning("No data loaded. Check paths.")
         return
 
+    # Background jobs refer to the data they were started on; drop them after a reload
+    if st.session_state.get('progressive_version') != data_version:
+        st.session_state['progressive_jobs'] = {}
+        st.session_state['progressive_version'] = data_version
+    st.session_state['progressive_pending'] = set()
+
     # Sidebar Controls
     st.sidebar.header("Configuration")
     category = st.sidebar.selectbox("Select Dataset Analysis", list(data.keys()))
     df = data[category]
 
+    preview_mode = st.sidebar.checkbox("⚡ Instant Preview (approximate)", key='preview_mode',
+                                       help="Answer from samples and sketches in milliseconds, then refine to exact results in the background.")
+    preview = previews.get(category) if preview_mode else None
+
     # Privacy Sidebar
     st.sidebar.markdown("---")
     st.sidebar.info("🔒 **Data Ethics & Privacy:**\nThis system uses only aggregated UIDAI hackathon datasets. No personal, biometric, or identifiable data is processed or inferred.")
@@ -74,7 +135,7 @@ def main():
 
     with tab1:
         st.subheader(f"Dataset Overview: {category.title()}")
-        stats = EDAService.get_basic_stats(df)
+        stats = EDAService.get_basic_stats(df, preview)
         
         c1, c2, c3 = st.columns(3)
         c1.metric("Total Rows", f"{stats['rows']:,}")
@@ -94,15 +155,30 @@ def main():
             insight = EDAService.generate_trend_insight(df, value_col=numeric_col)
             st.info(insight)
 
+        if preview is not None:
+            st.markdown("#### ⚡ Sketch Summary")
+            s1, s2 = st.columns(2)
+            pins = preview.distinct_pincodes()
+            s1.metric("Distinct Pincodes (≈)", f"{pins['estimate']:,} ± {pins['error']:,}")
+            s1.dataframe(preview.heavy_hitters(5), hide_index=True, use_container_width=True)
+            s2.markdown(f"**Volume Quantiles ({numeric_col})**")
+            s2.dataframe(preview.quantiles(numeric_col), hide_index=True, use_container_width=True)
+
     with tab2:
         st.subheader("Regional Performance")
         if 'state' in df.columns:
             st.markdown("#### Top States by Activity")
             # Reuse metric selection from Tab 1 or new one?
             state_metric = st.selectbox("Select Metric for State View", numerics, index=min(3, len(numerics)-1))
-            fig_state = EDAService.plot_state_distribution(df, value_col=state_metric)
+            fig_state, is_exact = progressive(('state_dist', category, state_metric),
+                                              lambda: EDAService.plot_state_distribution(df, value_col=state_metric, preview=preview),
+                                              lambda: EDAService.plot_state_distribution(df, value_col=state_metric))
             st.plotly_chart(fig_state, use_container_width=True)
-            st.caption(EDAService.generate_distribution_insight(df, group_col='state', value_col=state_metric))
+            preview_note(is_exact)
+            dist_insight, _ = progressive(('state_insight', category, state_metric),
+                                          lambda: EDAService.generate_distribution_insight(df, group_col='state', value_col=state_metric, preview=preview),
+                                          lambda: EDAService.generate_distribution_insight(df, group_col='state', value_col=state_metric))
+            st.caption(dist_insight)
             
             st.markdown("#### District Deep Dive")
             selected_state = st.selectbox("Filter by State", ["All"] + sorted(df['state'].unique().tolist()))
@@ -174,9 +250,12 @@ def main():
             st.markdown("### 1️⃣ Ghost Child Risk Indicator")
             c1, c2 = st.columns([3, 1])
             with c1:
-                risk_df = PolicyAnalyzer.calculate_ghost_child_risk(data['enrolment'], data['demographic'])
+                risk_df, is_exact = progressive(('ghost_child',),
+                                                lambda: PolicyAnalyzer.calculate_ghost_child_risk(data['enrolment'], data['demographic'], previews['enrolment'], previews['demographic']),
+                                                lambda: PolicyAnalyzer.calculate_ghost_child_risk(data['enrolment'], data['demographic']))
+                preview_note(is_exact)
                 if not risk_df.empty:
-                    st.dataframe(risk_df[['state', 'district', 'risk_score']].head(5), hide_index=True, use_container_width=True)
+                    st.dataframe(with_bounds(risk_df, ['state', 'district', 'risk_score'], ['risk_score_low', 'risk_score_high']).head(5), hide_index=True, use_container_width=True)
                 else:
                     st.info("Insufficient data.")
             with c2:
@@ -189,9 +268,12 @@ def main():
             st.markdown("### 2️⃣ Youth Disconnect Indicator")
             c1, c2 = st.columns([3, 1])
             with c1:
-                gap_df = PolicyAnalyzer.analyze_youth_engagement(data['demographic'], data['biometric'])
+                gap_df, is_exact = progressive(('youth_engagement',),
+                                               lambda: PolicyAnalyzer.analyze_youth_engagement(data['demographic'], data['biometric'], previews['demographic'], previews['biometric']),
+                                               lambda: PolicyAnalyzer.analyze_youth_engagement(data['demographic'], data['biometric']))
+                preview_note(is_exact)
                 if not gap_df.empty:
-                    st.dataframe(gap_df[['state', 'engagement_gap']].head(5), hide_index=True, use_container_width=True)
+                    st.dataframe(with_bounds(gap_df, ['state', 'engagement_gap'], ['engagement_gap_error']).head(5), hide_index=True, use_container_width=True)
             with c2:
                 st.warning("**Suggested Governance Action:**\nInitiate SMS campaigns for 18+ Mandatory Biometric Updates in these states.")
                 st.caption("ℹ️ **Reliability:** Derived from volume gap between adolescent demographic updates and adult biometric conversions.")
@@ -202,12 +284,30 @@ def main():
             st.markdown("### 3️⃣ Migration Signal Index")
             c1, c2 = st.columns([3, 1])
             with c1:
-                mig_df = PolicyAnalyzer.detect_migration_signals(data['demographic'])
-                if not mig_df.empty:
-                    st.dataframe(mig_df[['state', 'district', 'volatility_score']].head(5), hide_index=True, use_container_width=True)
+                # Same definition as PolicyAnalyzer.detect_migration_signals, from the cached sparse matrix
+                mig_matrix = load_migration_matrix(data_version)
+                mig_level = st.radio("Volatility Level", list(MigrationMatrix.LEVELS), index=1, horizontal=True, key='mig_level')
+                level_df = mig_matrix.volatility(mig_level)
+                label_cols = [c for c in ['state', 'district', 'pincode'] if c in level_df.columns]
+                st.dataframe(level_df[label_cols + ['volatility_score']].head(5), hide_index=True, use_container_width=True)
             with c2:
                 st.info("**Suggested Governance Action:**\nTemporarily increase Kendra working hours in these high-volatility districts to manage inward migration load.")
-                st.caption("ℹ️ **Reliability:** Measures temporal variance (Volatility Z-Score) of address updates.")
+                st.caption("ℹ️ **Reliability:** Measures temporal variance (Volatility Z-Score) of address updates, counting days without updates as zero.")
+
+            with st.expander("🔎 Surge Origins & Correlated Regions"):
+                mig_df = mig_matrix.volatility('district')
+                if not mig_df.empty:
+                    top = mig_df.iloc[0]
+                    st.markdown(f"#### Pincodes Driving Surges in {top['district']}, {top['state']}")
+                    st.dataframe(mig_matrix.surge_sources(top['state'], top['district']), hide_index=True, use_container_width=True)
+
+                st.markdown("#### Districts Surging on the Same Days")
+                st.caption("Only pairs sharing more surge days than independent surge rates explain (Bonferroni-corrected Poisson test).")
+                pairs_df = mig_matrix.correlated_surges('district')
+                if not pairs_df.empty:
+                    st.dataframe(pairs_df.head(10), hide_index=True, use_container_width=True)
+                else:
+                    st.info("No correlated surges detected.")
 
             st.divider()
 
@@ -233,11 +333,18 @@ def main():
             st.markdown("### 5️⃣ Aadhaar Kendra Performance Signal")
             c1, c2 = st.columns([3, 1])
             with c1:
-                kendra_df = PolicyAnalyzer.assess_kendra_performance(data['enrolment'], data['demographic'])
-                st.dataframe(kendra_df[['state', 'district', 'performance_score', 'kendra_status']].head(5), hide_index=True, use_container_width=True)
+                kendra_df, is_exact = progressive(('kendra',),
+                                                  lambda: PolicyAnalyzer.assess_kendra_performance(data['enrolment'], data['demographic'], previews['enrolment'], previews['demographic']),
+                                                  lambda: PolicyAnalyzer.assess_kendra_performance(data['enrolment'], data['demographic']))
+                preview_note(is_exact)
+                st.dataframe(with_bounds(kendra_df, ['state', 'district', 'performance_score', 'kendra_status'], ['performance_score_error']).head(5), hide_index=True, use_container_width=True)
             with c2:
                 st.success("**Suggested Governance Action:**\nExpansion Needed: Allocate new kits to 'High Load' districts. Optimization: Reduce shifts in 'Under-Utilized' zones.")
                 st.caption("ℹ️ **Reliability:** Composite Index of Total Activity (Enrolment + Update) normalized 0-100.")
 
+    # Swap previews for exact results as soon as their background jobs finish
+    if st.session_state['progressive_pending']:
+        refresh_when_exact()
+
 if __name__ == "__main__":
     main()
@@ -1,16 +1,81 @@
 import pandas as pd
 import glob
+import json
 import os
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from openpyxl import load_workbook
 from typing import Dict, List, Optional
 
+EXCEL_PATTERNS = ("*.xlsx", "*.xls")
+
+def _sheet_names(path: str) -> List[str]:
+    """Lists worksheet names without loading any cell data."""
+    if path.lower().endswith('.xls'):
+        return pd.ExcelFile(path).sheet_names
+    wb = load_workbook(path, read_only=True)
+    try:
+        return wb.sheetnames
+    finally:
+        wb.close()
+
+def _read_sheet(path: str, sheet_name: str) -> pd.DataFrame:
+    """
+    Reads one worksheet (first row as header). Runs in a worker process.
+    .xlsx sheets are streamed with openpyxl's read-only reader; legacy .xls goes through pandas.
+    """
+    if path.lower().endswith('.xls'):
+        return pd.read_excel(path, sheet_name=sheet_name)
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb[sheet_name].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        # Read-only sheets can report trailing blank rows
+        return pd.DataFrame.from_records(list(rows), columns=header).dropna(how='all')
+    finally:
+        wb.close()
+
+def _as_key(value) -> str:
+    """String form of a cell that keeps 110001, 110001.0 and '110001' as one key."""
+    if isinstance(value, datetime):
+        return value.strftime('%d-%m-%Y')
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def _normalise_types(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Resolves object columns holding mixed Python types (e.g. a pincode typed as
+    both 110001 and '110001' in Excel), which Parquet cannot store and which would
+    otherwise split one pincode into two keys. Columns become numeric when every
+    value converts, otherwise strings via _as_key (dates in the CSV drops' DD-MM-YYYY format).
+    Uniform columns are detected with pandas' type inference and left untouched.
+    """
+    for col in df.columns[df.dtypes == object]:
+        if not pd.api.types.infer_dtype(df[col], skipna=True).startswith('mixed'):
+            continue
+        numeric = pd.to_numeric(df[col], errors='coerce')
+        if numeric.notna().sum() == df[col].notna().sum():
+            df[col] = numeric
+        else:
+            df[col] = df[col].map(_as_key, na_action='ignore')
+    return df
+
 class DataLoader:
     """
     Intelligent Data Loader for the UIDAI Hackathon.
-    Handles multi-file CSV ingestion, schema unification, and basic cleanup.
+    Handles multi-file CSV/Excel ingestion, schema unification, and basic cleanup.
+    Excel workbooks are parsed once (sheets in parallel) and cached as Parquet,
+    so later loads never touch openpyxl.
     """
     
-    def __init__(self, base_path: str):
+    def __init__(self, base_path: str, cache_dir: Optional[str] = None, max_workers: Optional[int] = None):
         self.base_path = base_path
+        self.cache_dir = cache_dir or os.path.join(base_path, ".columnar_cache")
+        self.max_workers = max_workers
         # Mapping friendly names to folder names
         self.categories = {
             "enrolment": "api_data_aadhar_enrolment",
@@ -20,7 +85,7 @@ class DataLoader:
 
     def load_category(self, category: str) -> pd.DataFrame:
         """
-        Loads all CSV files for a specific category into a single DataFrame.
+        Loads all CSV and Excel files for a specific category into a single DataFrame.
         """
         if category not in self.categories:
             raise ValueError(f"Category '{category}' not found. Available: {list(self.categories.keys())}")
@@ -28,14 +93,16 @@ class DataLoader:
         folder_name = self.categories[category]
         search_path = os.path.join(self.base_path, folder_name, "*.csv")
         files = glob.glob(search_path)
+        excel_files = [f for pattern in EXCEL_PATTERNS
+                       for f in glob.glob(os.path.join(self.base_path, folder_name, pattern))]
         
-        if not files:
-            print(f"Warning: No CSV files found for {category} in {search_path}")
+        if not files and not excel_files:
+            print(f"Warning: No CSV/Excel files found for {category} in {os.path.dirname(search_path)}")
             return pd.DataFrame()
 
-        print(f"Loading {len(files)} files for category: {category}...")
+        print(f"Loading {len(files) + len(excel_files)} files for category: {category}...")
         
-        dfs = []
+        dfs = self._load_excel_files(category, excel_files)
         for file in files:
             try:
                 # Use low_memory=False to handle mixed types during initial load
@@ -48,12 +115,118 @@ class DataLoader:
         if not dfs:
             return pd.DataFrame()
             
-        # Concatenate all
-        full_df = pd.concat(dfs, ignore_index=True)
+        # Concatenate all (files can disagree on a column's type, so normalise again)
+        full_df = _normalise_types(pd.concat(dfs, ignore_index=True))
         print(f"Total rows for {category}: {len(full_df)}")
         
         return full_df
 
+    def _cache_path(self, category: str, file: str) -> str:
+        return os.path.join(self.cache_dir, f"{category}__{os.path.basename(file)}.parquet")
+
+    @staticmethod
+    def _source_signature(file: str) -> Dict[str, int]:
+        stat = os.stat(file)
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _cache_is_fresh(self, cache: str, file: str) -> bool:
+        """
+        A cache entry is used only if the sidecar recorded for it matches the source's
+        current size and mtime exactly. Comparing mtimes by order would serve stale data
+        after an unzip or `cp -p`, which give a replaced workbook an older mtime.
+        """
+        try:
+            with open(f"{cache}.json") as f:
+                return os.path.exists(cache) and json.load(f) == self._source_signature(file)
+        except (OSError, ValueError):
+            return False
+
+    def _write_cache(self, cache: str, signature: Dict[str, int], df: pd.DataFrame):
+        """Writes the Parquet file, then its sidecar; any failure leaves no usable entry."""
+        meta = f"{cache}.json"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            if os.path.exists(meta):
+                os.remove(meta)
+            df.to_parquet(cache, index=False)
+            with open(meta, "w") as f:
+                json.dump(signature, f)
+        except Exception as e:
+            print(f" - Could not cache {os.path.basename(cache)}: {e}")
+
+    def _load_excel_files(self, category: str, files: List[str]) -> List[pd.DataFrame]:
+        """
+        Loads workbooks from the Parquet cache when it matches the source.
+        Stale or uncached workbooks have all their sheets parsed in a process pool,
+        then each workbook is written to the cache. A workbook with any failed sheet
+        is returned without it but not cached, so the next load retries the sheet.
+        """
+        dfs = []
+        pending = []
+        for file in files:
+            cache = self._cache_path(category, file)
+            if self._cache_is_fresh(cache, file):
+                try:
+                    df = pd.read_parquet(cache)
+                    dfs.append(df)
+                    print(f" - Loaded {os.path.basename(file)} (cached): {df.shape}")
+                    continue
+                except Exception as e:
+                    print(f" - Error reading cache for {file}, re-parsing: {e}")
+            pending.append(file)
+
+        if not pending:
+            return dfs
+
+        # Signatures are taken before parsing so an edit made mid-parse invalidates the entry
+        signatures = {}
+        tasks = []
+        for file in pending:
+            try:
+                signatures[file] = self._source_signature(file)
+                tasks.extend((file, sheet) for sheet in _sheet_names(file))
+            except Exception as e:
+                print(f" - Error loading {file}: {e}")
+
+        # A single sheet is not worth the process start-up cost
+        if len(tasks) == 1:
+            sheets = {tasks[0]: self._read_inline(*tasks[0])}
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = {task: pool.submit(_read_sheet, *task) for task in tasks}
+                sheets = {task: self._collect(future, *task) for task, future in futures.items()}
+
+        for file in pending:
+            results = [df for (f, _), df in sheets.items() if f == file]
+            parts = [df for df in results if df is not None and not df.empty]
+            if not parts:
+                continue
+            df = _normalise_types(pd.concat(parts, ignore_index=True))
+            dfs.append(df)
+            print(f" - Loaded {os.path.basename(file)} ({len(parts)} sheets): {df.shape}")
+            if any(r is None for r in results):
+                print(f" - Not caching {file}: some sheets failed to load")
+                continue
+            self._write_cache(self._cache_path(category, file), signatures[file], df)
+
+        return dfs
+
+    @staticmethod
+    def _collect(future, file: str, sheet: str) -> Optional[pd.DataFrame]:
+        try:
+            return future.result()
+        except Exception as e:
+            print(f" - Error loading {file} [{sheet}]: {e}")
+            return None
+
+    @staticmethod
+    def _read_inline(file: str, sheet: str) -> Optional[pd.DataFrame]:
+        try:
+            return _read_sheet(file, sheet)
+        except Exception as e:
+            print(f" - Error loading {file} [{sheet}]: {e}")
+            return None
+
     def load_all(self) -> Dict[str, pd.DataFrame]:
         """
         Loads all categories and returns a dictionary of DataFrames.
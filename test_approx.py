@@ -0,0 +1,145 @@
+import pandas as pd
+import numpy as np
+import time
+import sys
+import os
+
+sys.path.append(os.getcwd())
+from aadhaar_eco.analysis.sketches import CountMinSketch, HyperLogLog, TDigest
+from aadhaar_eco.analysis.approx import DatasetPreview, ProgressiveResult
+from aadhaar_eco.analysis.eda import EDAService
+from aadhaar_eco.analysis.policy import PolicyAnalyzer
+
+def make_data(n=200_000, seed=0):
+    # Mock demographic-style data: 10 states x 60 days, skewed district volumes
+    rng = np.random.default_rng(seed)
+    states = rng.choice([f"S{i}" for i in range(10)], n)
+    return pd.DataFrame({
+        'date': rng.choice(pd.date_range('2025-03-01', periods=60), n),
+        'state': states,
+        'district': pd.Series(states) + '_D' + pd.Series(rng.zipf(1.6, n) % 20).astype(str),
+        'pincode': rng.integers(100000, 130000, n),
+        'age_0_5': rng.poisson(5, n),
+        'demo_age_5_17': rng.lognormal(2, 1, n).round()
+    })
+
+def test_sketches():
+    rng = np.random.default_rng(1)
+
+    print("Testing Count-Min (never undercounts)...")
+    keys = rng.zipf(1.5, 300_000) % 3000
+    cms = CountMinSketch()
+    cms.update(keys)
+    exact = pd.Series(keys).value_counts()
+    estimate = cms.estimate(exact.index.to_numpy())
+    assert (estimate >= exact.to_numpy()).all()
+    assert (estimate - exact.to_numpy()).max() <= cms.error_bound
+
+    print("Testing HyperLogLog (within 3 standard errors)...")
+    hll = HyperLogLog()
+    values = rng.integers(0, 500_000, 400_000)
+    for chunk in np.array_split(values, 4):
+        hll.update(chunk)
+    distinct = len(np.unique(values))
+    assert abs(hll.estimate() - distinct) / distinct <= 3 * hll.relative_error
+
+    print("Testing t-digest (estimate inside centroid bounds, close to exact)...")
+    digest = TDigest()
+    volumes = rng.lognormal(3, 1, 300_000)
+    for chunk in np.array_split(volumes, 5):
+        digest.update(chunk)
+    for q in (0.01, 0.5, 0.9, 0.99):
+        lower, upper = digest.quantile_bounds(q)
+        estimate = digest.quantile(q)
+        assert lower <= estimate <= upper
+        assert abs(estimate - np.quantile(volumes, q)) / np.quantile(volumes, q) < 0.02
+
+def test_preview_bounds():
+    print("Testing stratified estimates cover exact totals...")
+    df = make_data()
+    preview = DatasetPreview(df)
+
+    # 95% bounds over 60 daily totals; allow for a few misses from small strata
+    estimate = preview.estimate_totals(['date'], 'age_0_5')
+    exact = df.groupby('date')['age_0_5'].sum().reset_index()
+    merged = estimate.merge(exact, on='date', suffixes=('_est', ''))
+    assert len(merged) == len(exact)
+    assert ((merged['age_0_5_est'] - merged['age_0_5']).abs() <= merged['error']).mean() >= 0.85
+
+    counts = preview.district_counts()
+    exact_counts = df.groupby(['state', 'district']).size().reset_index(name='exact')
+    merged = counts.merge(exact_counts, on=['state', 'district'])
+    assert (merged['count'] >= merged['exact']).all()
+    assert (merged['count'] - merged['exact'] <= merged['error']).all()
+
+    pins = preview.distinct_pincodes()
+    assert abs(pins['estimate'] - df['pincode'].nunique()) <= pins['error']
+    assert preview.basic_stats()['rows'] == len(df)
+
+def test_preview_edge_cases():
+    print("Testing NaT dates and empty input...")
+    df = make_data(50_000)
+    df.loc[df.sample(2000, random_state=0).index, 'date'] = pd.NaT
+    preview = DatasetPreview(df)
+
+    daily = preview.estimate_totals(['date'], 'age_0_5')
+    assert daily['date'].notna().all()
+    assert len(daily) == df['date'].nunique()
+    # The trend insight's end value must come from the last real date, not a NaT group
+    assert daily['date'].iloc[-1] == df['date'].max()
+    assert EDAService.generate_distribution_insight(df, value_col='age_0_5', preview=preview)
+
+    empty = DatasetPreview(pd.DataFrame(columns=['date', 'state', 'district', 'pincode', 'age_0_5']))
+    assert empty.rows == 0
+    assert empty.estimate_totals(['state'], 'age_0_5').empty
+    assert empty.district_counts().empty
+
+def test_progressive_result():
+    print("Testing progressive refinement and failure fallback...")
+    job = ProgressiveResult('approx', lambda: (time.sleep(0.2), 'exact')[1])
+    assert job.result() == 'approx' and not job.is_exact
+    job.exact()
+    assert job.result() == 'exact' and job.is_exact
+
+    calls = []
+    def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("transient")
+        return 'exact'
+    job = ProgressiveResult('approx', flaky)
+    time.sleep(0.1)
+    assert job.result() == 'exact' and job.is_exact
+    assert isinstance(job.error, RuntimeError)
+    # The exact query's closure is dropped once it has succeeded
+    assert job._exact_fn is None
+
+def test_policy_bounds():
+    print("Testing derived governance scores carry bounds...")
+    enrolment = make_data(seed=1)
+    demographic = make_data(seed=2)
+    enrol_preview, demo_preview = DatasetPreview(enrolment), DatasetPreview(demographic)
+
+    risk = PolicyAnalyzer.calculate_ghost_child_risk(enrolment, demographic, enrol_preview, demo_preview)
+    assert (risk['risk_score_low'] <= risk['risk_score'] + 1e-9).all()
+    assert (risk['risk_score'] <= risk['risk_score_high'] + 1e-9).all()
+
+    biometric = enrolment.rename(columns={'age_0_5': 'bio_age_17_'})
+    gap = PolicyAnalyzer.analyze_youth_engagement(demographic, biometric, demo_preview, DatasetPreview(biometric))
+    assert (gap['engagement_gap_error'] == gap['demo_age_5_17_error'] + gap['bio_age_17__error']).all()
+
+    kendra = PolicyAnalyzer.assess_kendra_performance(enrolment, demographic, enrol_preview, demo_preview)
+    exact = PolicyAnalyzer.assess_kendra_performance(enrolment, demographic)
+    merged = kendra.merge(exact, on=['state', 'district'], suffixes=('', '_exact'))
+    assert ((merged['performance_score'] - merged['performance_score_exact']).abs() <= merged['performance_score_error'] + 0.1).all()
+
+    # Exact results have no bound columns
+    assert 'risk_score_low' not in PolicyAnalyzer.calculate_ghost_child_risk(enrolment, demographic).columns
+
+if __name__ == "__main__":
+    test_sketches()
+    test_preview_bounds()
+    test_preview_edge_cases()
+    test_progressive_result()
+    test_policy_bounds()
+    print("All approximate-query checks passed.")
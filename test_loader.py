@@ -0,0 +1,127 @@
+import pandas as pd
+import numpy as np
+import tempfile
+import time
+import sys
+import os
+
+sys.path.append(os.getcwd())
+import aadhaar_eco.data.loader as loader_module
+from aadhaar_eco.data.loader import DataLoader
+
+FOLDER = "api_data_aadhar_enrolment"
+
+def make_sheet(n, seed):
+    # Mock enrolment rows in the CSV drops' schema
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'date': ['02-03-2025'] * n,
+        'state': 'Goa',
+        'district': 'North Goa',
+        'pincode': rng.integers(403001, 403100, n),
+        'age_0_5': rng.integers(0, 9, n)
+    })
+
+def write_workbook(path, sheets):
+    with pd.ExcelWriter(path) as writer:
+        for name, df in sheets.items():
+            df.to_excel(writer, sheet_name=name, index=False)
+
+def test_multi_sheet_round_trip():
+    print("Testing multi-sheet .xlsx round trip and cache hit...")
+    with tempfile.TemporaryDirectory() as base:
+        os.makedirs(os.path.join(base, FOLDER))
+        sheets = {f"S{i}": make_sheet(500, i) for i in range(3)}
+        # Pincode typed as text in one sheet, as happens in hand-edited workbooks
+        sheets['S2'] = sheets['S2'].astype({'pincode': str})
+        write_workbook(os.path.join(base, FOLDER, "goa.xlsx"), sheets)
+
+        loader = DataLoader(base, max_workers=2)
+        first = loader.load_category('enrolment')
+        expected = pd.concat(sheets.values(), ignore_index=True).astype({'pincode': 'int64'})
+        assert first.shape == expected.shape
+        assert first['pincode'].dtype.kind == 'i'
+        assert (first['pincode'].to_numpy() == expected['pincode'].to_numpy()).all()
+        assert os.path.exists(loader._cache_path('enrolment', os.path.join(base, FOLDER, "goa.xlsx")))
+
+        # A cache hit must never reach openpyxl
+        def fail(*args, **kwargs):
+            raise AssertionError("openpyxl used despite a fresh cache")
+        original = loader_module.load_workbook, loader_module._read_sheet
+        loader_module.load_workbook = loader_module._read_sheet = fail
+        try:
+            cached = DataLoader(base).load_category('enrolment')
+        finally:
+            loader_module.load_workbook, loader_module._read_sheet = original
+        pd.testing.assert_frame_equal(cached, first)
+
+def test_cache_invalidation():
+    print("Testing cache invalidation when the source is replaced...")
+    with tempfile.TemporaryDirectory() as base:
+        os.makedirs(os.path.join(base, FOLDER))
+        path = os.path.join(base, FOLDER, "goa.xlsx")
+        write_workbook(path, {"S0": make_sheet(100, 0), "S1": make_sheet(100, 1)})
+        assert len(DataLoader(base).load_category('enrolment')) == 200
+
+        write_workbook(path, {"S0": make_sheet(100, 0), "S1": make_sheet(100, 1), "S2": make_sheet(50, 2)})
+        future = time.time() + 10
+        os.utime(path, (future, future))
+        assert len(DataLoader(base).load_category('enrolment')) == 250
+
+        # Replaced with an older mtime, as after an unzip or `cp -p`
+        write_workbook(path, {"S0": make_sheet(100, 0)})
+        past = time.time() - 86400
+        os.utime(path, (past, past))
+        assert len(DataLoader(base).load_category('enrolment')) == 100
+
+def test_unwritable_cache():
+    print("Testing an unwritable cache directory falls back to parsing...")
+    with tempfile.TemporaryDirectory() as base:
+        os.makedirs(os.path.join(base, FOLDER))
+        write_workbook(os.path.join(base, FOLDER, "goa.xlsx"), {"S0": make_sheet(100, 0), "S1": make_sheet(100, 1)})
+        # A regular file where the cache directory should be (NotADirectoryError on makedirs)
+        blocker = os.path.join(base, "blocker")
+        open(blocker, "w").close()
+        loader = DataLoader(base, cache_dir=os.path.join(blocker, "cache"))
+        assert len(loader.load_category('enrolment')) == 200
+        assert len(loader.load_category('enrolment')) == 200
+
+def test_mixed_pincodes_unify():
+    print("Testing float and text pincodes across files collapse to one key...")
+    with tempfile.TemporaryDirectory() as base:
+        os.makedirs(os.path.join(base, FOLDER))
+        # A blank pincode makes the CSV column float (110001.0); the workbook types it as text
+        csv = make_sheet(2, 0).assign(pincode=[110001.0, np.nan])
+        csv.to_csv(os.path.join(base, FOLDER, "delhi.csv"), index=False)
+        sheet = make_sheet(2, 1).assign(pincode=['110001', 'N/A'])
+        write_workbook(os.path.join(base, FOLDER, "delhi.xlsx"), {"S0": sheet})
+
+        df = DataLoader(base).load_category('enrolment')
+        assert sorted(df['pincode'].dropna().tolist()) == ['110001', '110001', 'N/A']
+
+def test_failed_sheet_not_cached():
+    print("Testing a failed sheet skips caching...")
+    with tempfile.TemporaryDirectory() as base:
+        os.makedirs(os.path.join(base, FOLDER))
+        path = os.path.join(base, FOLDER, "goa.xlsx")
+        write_workbook(path, {"S0": make_sheet(100, 0)})
+
+        loader = DataLoader(base)
+        original = loader_module._read_sheet
+        def flaky(*args, **kwargs):
+            raise OSError("transient read error")
+        loader_module._read_sheet = flaky
+        try:
+            assert loader.load_category('enrolment').empty
+        finally:
+            loader_module._read_sheet = original
+        assert not os.path.exists(loader._cache_path('enrolment', path))
+        assert len(loader.load_category('enrolment')) == 100
+
+if __name__ == "__main__":
+    test_multi_sheet_round_trip()
+    test_cache_invalidation()
+    test_unwritable_cache()
+    test_mixed_pincodes_unify()
+    test_failed_sheet_not_cached()
+    print("All loader checks passed.")
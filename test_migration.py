@@ -0,0 +1,85 @@
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.getcwd())
+from aadhaar_eco.analysis.migration import MigrationMatrix
+from aadhaar_eco.analysis.policy import PolicyAnalyzer
+
+def make_data(seed=0):
+    # Mock background activity over 2 states x 5 districts x 4 pincodes x 60 days
+    rng = np.random.default_rng(seed)
+    n = 20_000
+    dates = pd.date_range('2025-01-01', periods=60)
+    states = rng.choice(['A', 'B'], n)
+    districts = pd.Series(states) + pd.Series(rng.integers(0, 5, n)).astype(str)
+    df = pd.DataFrame({
+        'state': states,
+        'district': districts,
+        'pincode': districts + '_' + pd.Series(rng.integers(0, 4, n)).astype(str),
+        'date': rng.choice(dates, n)
+    })
+
+    # Planted co-surge: one pincode in A1 and one in B2 spike on the same four days
+    spikes = [
+        pd.DataFrame({'state': s, 'district': d, 'pincode': p, 'date': dates[day]}, index=range(300))
+        for s, d, p in [('A', 'A1', 'A1_0'), ('B', 'B2', 'B2_3')]
+        for day in (10, 25, 40, 55)
+    ]
+    return pd.concat([df] + spikes, ignore_index=True)
+
+def test_volatility_matches_dense():
+    print("Testing sparse volatility against dense numpy...")
+    matrix = MigrationMatrix(make_data())
+    for level in MigrationMatrix.LEVELS:
+        dense = matrix.level_matrix(level).toarray()
+        result = matrix.volatility(level).sort_index()
+        assert np.allclose(result['raw_volatility'], dense.var(axis=1, ddof=1))
+        assert (result['total_updates'] == dense.sum(axis=1)).all()
+
+def test_planted_surge():
+    print("Testing planted co-surge recovery...")
+    df = make_data()
+    matrix = MigrationMatrix(df)
+
+    pairs = matrix.correlated_surges('district')
+    top = pairs.iloc[0]
+    assert {(top['state_a'], top['district_a']), (top['state_b'], top['district_b'])} == {('A', 'A1'), ('B', 'B2')}
+    assert top['co_surges'] == 4
+    assert top['co_surges'] > top['expected_co_surges']
+
+    sources = matrix.surge_sources('A', 'A1')
+    assert sources.iloc[0]['pincode'] == 'A1_0'
+    assert sources.iloc[0]['surge_share'] > 50
+
+    # The policy index shares the matrix definition
+    signals = PolicyAnalyzer.detect_migration_signals(df)
+    assert set(signals.head(2)['district']) == {'A1', 'B2'}
+
+def test_noise_has_no_correlated_surges():
+    print("Testing pure noise yields no correlated surges...")
+    rng = np.random.default_rng(1)
+    n = 200_000
+    districts = pd.Series(rng.integers(0, 100, n)).astype(str)
+    df = pd.DataFrame({
+        'state': 'A',
+        'district': districts,
+        'pincode': districts + '_' + pd.Series(rng.integers(0, 3, n)).astype(str),
+        'date': rng.choice(pd.date_range('2025-01-01', periods=90), n)
+    })
+    matrix = MigrationMatrix(df)
+    assert matrix.correlated_surges('district').empty
+
+    matrix.MAX_PAIR_REGIONS = 10
+    try:
+        matrix.correlated_surges('pincode')
+        assert False, "pincode level should exceed the pair guard"
+    except ValueError:
+        pass
+
+if __name__ == "__main__":
+    test_volatility_matches_dense()
+    test_planted_surge()
+    test_noise_has_no_correlated_surges()
+    print("All migration matrix checks passed.")